@@ -1,11 +1,10 @@
 import os
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from pymongo import MongoClient
-from pymongo.collection import Collection
-from pymongo.errors import PyMongoError
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo.errors import DuplicateKeyError, PyMongoError
 
 logger = logging.getLogger("database")
 logging.basicConfig(level=logging.INFO)
@@ -13,62 +12,85 @@ logging.basicConfig(level=logging.INFO)
 DATABASE_URL = os.getenv("DATABASE_URL", "mongodb://localhost:27017")
 DATABASE_NAME = os.getenv("DATABASE_NAME", "appdb")
 
-_client = MongoClient(DATABASE_URL)
+# fail fast when Mongo is unreachable instead of queueing requests for the 30s default
+_client = AsyncIOMotorClient(
+    DATABASE_URL,
+    maxPoolSize=50,
+    minPoolSize=5,
+    serverSelectionTimeoutMS=2000,
+    connectTimeoutMS=2000,
+    socketTimeoutMS=5000,
+    retryWrites=True,
+    compressors="zstd",
+)
 db = _client[DATABASE_NAME]
 
 
-def _collection(name: str) -> Collection:
+def _collection(name: str) -> AsyncIOMotorCollection:
     return db[name]
 
 
-def create_document(collection_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+async def create_document(collection_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     try:
         now = datetime.utcnow()
         data.setdefault("created_at", now)
         data["updated_at"] = now
-        res = _collection(collection_name).insert_one(data)
+        res = await _collection(collection_name).insert_one(data)
         data["_id"] = str(res.inserted_id)
         return data
+    except DuplicateKeyError:
+        # expected when a unique index rejects the write; callers map it to a 4xx
+        raise
     except PyMongoError as e:
         logger.exception("Mongo insert failed: %s", e)
         raise
 
 
-def get_documents(
+async def iter_documents(
     collection_name: str,
     filter_dict: Optional[Dict[str, Any]] = None,
     limit: Optional[int] = None,
     sort: Optional[List] = None,
-) -> List[Dict[str, Any]]:
+    projection: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
     try:
-        cursor = _collection(collection_name).find(filter_dict or {})
+        # large batches mean fewer getMore round-trips than the driver's 101-doc first batch
+        cursor = _collection(collection_name).find(filter_dict or {}, projection=projection).batch_size(1000)
         if sort:
             cursor = cursor.sort(sort)
         if limit:
             cursor = cursor.limit(limit)
-        items = []
-        for doc in cursor:
+        async for doc in cursor:
             doc["_id"] = str(doc.get("_id"))
-            items.append(doc)
-        return items
+            yield doc
     except PyMongoError as e:
         logger.exception("Mongo query failed: %s", e)
         raise
 
 
-def update_document(collection_name: str, filter_dict: Dict[str, Any], update: Dict[str, Any]) -> int:
+async def get_documents(
+    collection_name: str,
+    filter_dict: Optional[Dict[str, Any]] = None,
+    limit: Optional[int] = None,
+    sort: Optional[List] = None,
+    projection: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    return [doc async for doc in iter_documents(collection_name, filter_dict, limit, sort, projection)]
+
+
+async def update_document(collection_name: str, filter_dict: Dict[str, Any], update: Dict[str, Any]) -> int:
     try:
-        update.setdefault("$set", {})
-        update["$set"]["updated_at"] = datetime.utcnow()
-        res = _collection(collection_name).update_many(filter_dict, update)
+        # let the server stamp the time instead of shipping a client-side clock
+        update.setdefault("$currentDate", {})["updated_at"] = True
+        res = await _collection(collection_name).update_one(filter_dict, update)
         return res.modified_count
     except PyMongoError as e:
         logger.exception("Mongo update failed: %s", e)
         raise
 
 
-def get_one(collection_name: str, filter_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    doc = _collection(collection_name).find_one(filter_dict)
+async def get_one(collection_name: str, filter_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    doc = await _collection(collection_name).find_one(filter_dict)
     if doc:
         doc["_id"] = str(doc.get("_id"))
     return doc
@@ -1,17 +1,29 @@
-import csv
 import io
 import logging
 import os
+import time
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+import jwt
+import orjson
+from bson import ObjectId
+from bson.errors import InvalidId
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
 from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-
-from database import create_document, db, get_documents, get_one, update_document
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.security import OAuth2PasswordBearer
+from jwt.exceptions import PyJWTError as JWTError
+from pydantic import TypeAdapter
+from pymongo.errors import DuplicateKeyError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from database import create_document, db, get_documents, get_one, iter_documents, update_document
 from schemas import (
     Attendance,
     JobGroup,
@@ -25,24 +37,72 @@ from schemas import (
 logger = logging.getLogger("api")
 logging.basicConfig(level=logging.INFO)
 
-SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret")
-ALGORITHM = "HS256"
+
+def _load_token_keys():
+    # SECRET_KEY / VERIFY_KEY hold the PEM Ed25519 private / public keys
+    secret_pem = os.getenv("SECRET_KEY")
+    if secret_pem:
+        try:
+            private_key = serialization.load_pem_private_key(secret_pem.encode(), password=None)
+        except (ValueError, TypeError) as e:
+            raise RuntimeError("SECRET_KEY must be an unencrypted PEM Ed25519 private key") from e
+        if not isinstance(private_key, Ed25519PrivateKey):
+            raise RuntimeError("SECRET_KEY must be an Ed25519 private key, got %s" % type(private_key).__name__)
+    elif os.getenv("ALLOW_EPHEMERAL_TOKEN_KEY") == "1":
+        # per-process key: tokens don't survive restarts and aren't shared between workers
+        logger.warning("SECRET_KEY not set; signing tokens with an ephemeral Ed25519 key")
+        private_key = Ed25519PrivateKey.generate()
+    else:
+        raise RuntimeError("SECRET_KEY is not set (set ALLOW_EPHEMERAL_TOKEN_KEY=1 for a throwaway dev key)")
+    verify_pem = os.getenv("VERIFY_KEY")
+    if not verify_pem:
+        return private_key, private_key.public_key()
+    try:
+        public_key = serialization.load_pem_public_key(verify_pem.encode())
+    except (ValueError, TypeError) as e:
+        raise RuntimeError("VERIFY_KEY must be a PEM Ed25519 public key") from e
+    if not isinstance(public_key, Ed25519PublicKey):
+        raise RuntimeError("VERIFY_KEY must be an Ed25519 public key, got %s" % type(public_key).__name__)
+    return private_key, public_key
+
+
+SECRET_KEY, VERIFY_KEY = _load_token_keys()
+ALGORITHM = "EdDSA"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 12
+OTP_EXPIRE_SECONDS = 5 * 60
+SAFETY_DOC_CACHE_MAX_SECONDS = 6 * 60 * 60
+SAFETY_DOC_CACHE_MISS_SECONDS = 30
+TOKEN_CACHE_BUCKET_SECONDS = 30
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# comma-separated, e.g. "https://app.example.com,https://admin.example.com"
+CORS_ORIGINS = [o.strip() for o in os.getenv("CORS_ORIGINS", "").split(",") if o.strip()]
+# e.g. r"http://localhost:\d+" for local development
+CORS_ORIGIN_REGEX = os.getenv("CORS_ORIGIN_REGEX")
 
 app = FastAPI(title="Attendance & Safety API")
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    # fall back to "*" only when neither origins nor a regex are configured
+    allow_origins=CORS_ORIGINS or ([] if CORS_ORIGIN_REGEX else ["*"]),
+    allow_origin_regex=CORS_ORIGIN_REGEX,
+    # credentials are only valid with explicit origins, never with "*"
+    allow_credentials=bool(CORS_ORIGINS or CORS_ORIGIN_REGEX),
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Built once at import; dump_python(mode="json") stores dates as ISO strings,
+# which is the form every date query below compares against.
+JOB_GROUP_ADAPTER = TypeAdapter(JobGroup)
+USER_ADAPTER = TypeAdapter(User)
+SAFETY_DOC_ADAPTER = TypeAdapter(SafetyDocument)
+ATTENDANCE_ADAPTER = TypeAdapter(Attendance)
+
+# Bearer token from the Authorization header; a missing header is a 401
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-# Simple OTP store (in-memory for demo). In production, use Redis or provider like Supabase/Authy.
-OTP_STORE: Dict[str, str] = {}
+# OTPs live in Redis so every worker sees the same codes and they expire on their own.
+redis = Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -53,68 +113,26 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
-async def get_current_user(token: str | None = None) -> Dict[str, Any]:
-    # token comes via Authorization header Bearer <token> when used with dependencies below
-    from fastapi import Request
+@lru_cache(maxsize=4096)
+def _decode_token(token: str, now_bucket: int) -> Dict[str, Any]:
+    # now_bucket is only part of the cache key, so entries roll over every TOKEN_CACHE_BUCKET_SECONDS
+    return jwt.decode(token, VERIFY_KEY, algorithms=[ALGORITHM])
 
-    def _extract_token(req: Request) -> Optional[str]:
-        auth = req.headers.get("authorization") or req.headers.get("Authorization")
-        if not auth:
-            return None
-        parts = auth.split()
-        if len(parts) == 2 and parts[0].lower() == "bearer":
-            return parts[1]
-        return None
-
-    # Use request context to get header if not directly provided
-    try:
-        from starlette.requests import Request as StarletteRequest
-        req: StarletteRequest = StarletteRequest(scope={})  # placeholder not used
-    except Exception:
-        pass
 
+def get_current_user(token: str = Depends(oauth2_scheme)) -> Dict[str, Any]:
+    now = time.time()
     try:
-        from fastapi import Request
-        request: Request = Depends()  # will be overridden by FastAPI
-    except Exception:
-        request = None  # type: ignore
-
-    # FastAPI pattern: define inner dependency to read header
-    from fastapi import Header
-
-    async def _token_from_header(authorization: str | None = Header(default=None)):
-        if not authorization:
-            return None
-        parts = authorization.split()
-        if len(parts) == 2 and parts[0].lower() == "bearer":
-            return parts[1]
-        return None
-
-    # decode token
-    if token is None:
-        # try nothing; in FastAPI route we'll provide token via dependency injection
-        pass
-
-    # We'll actually handle token decoding in a separate dependency below for clarity
-    raise HTTPException(status_code=401, detail="Unauthorized")
-
-
-def decode_token_dependency(authorization: str | None = None) -> Dict[str, Any]:
-    if not authorization:
-        raise HTTPException(status_code=401, detail="Missing Authorization header")
-    parts = authorization.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        raise HTTPException(status_code=401, detail="Invalid Authorization header")
-    token = parts[1]
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        payload = _decode_token(token, int(now) // TOKEN_CACHE_BUCKET_SECONDS)
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
+    # a cached payload may have expired since it was decoded
+    if payload.get("exp", now) < now:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    return payload
 
 
 def require_role(*roles: str):
-    def _inner(payload: Dict[str, Any] = Depends(decode_token_dependency)):
+    def _inner(payload: Dict[str, Any] = Depends(get_current_user)):
         user_role = payload.get("role")
         if not user_role or user_role not in roles:
             raise HTTPException(status_code=403, detail="Forbidden: insufficient role")
@@ -123,6 +141,16 @@ def require_role(*roles: str):
     return _inner
 
 
+@app.on_event("startup")
+async def ensure_indexes():
+    # (user_id, date) is unique so "one sign per user per day" is enforced by Mongo itself
+    await db.attendance.create_index([("user_id", 1), ("date", 1)], unique=True)
+    await db.attendance.create_index([("date", 1)])
+    await db.safetydocument.create_index([("date", -1)])
+    await db.user.create_index([("email", 1)], sparse=True)
+    await db.user.create_index([("phone", 1)], sparse=True)
+
+
 @app.get("/")
 async def health():
     return {"ok": True, "service": "api", "time": datetime.utcnow().isoformat()}
@@ -132,7 +160,7 @@ async def health():
 async def test_db():
     try:
         # quick roundtrip
-        db.list_collection_names()
+        await db.list_collection_names()
         return {"ok": True, "db": "connected"}
     except Exception as e:
         return JSONResponse(status_code=500, content={"ok": False, "error": str(e)})
@@ -145,7 +173,7 @@ async def request_otp(req: OTPRequest):
         raise HTTPException(400, "Provide email or phone")
     identifier = (req.email or req.phone).lower() if req.email else req.phone
     code = "123456"  # demo static
-    OTP_STORE[identifier] = code
+    await redis.setex(f"otp:{identifier}", OTP_EXPIRE_SECONDS, code)
     logger.info("OTP for %s is %s", identifier, code)
     return {"sent": True}
 
@@ -155,8 +183,9 @@ async def login(req: LoginRequest):
     identifier = (req.email or req.phone)
     if not identifier:
         raise HTTPException(400, "Missing identifier")
-    expected = OTP_STORE.get(identifier.lower() if req.email else identifier)
-    if not expected or req.otp != expected:
+    # single use: the code is dropped on the first attempt, right or wrong
+    expected = await redis.getdel(f"otp:{identifier.lower() if req.email else identifier}")
+    if not expected or req.otp != expected.decode():
         raise HTTPException(401, "Invalid OTP")
     # find or create user by email/phone
     filter_q: Dict[str, Any] = {}
@@ -164,83 +193,114 @@ async def login(req: LoginRequest):
         filter_q = {"email": req.email}
     else:
         filter_q = {"phone": req.phone}
-    user = get_one("user", filter_q)
+    user = await get_one("user", filter_q)
     if not user:
         # auto-provision minimal member
-        user = create_document("user", {"full_name": identifier, **filter_q, "role": "member", "active": True})
+        user = await create_document("user", {"full_name": identifier, **filter_q, "role": "member", "active": True})
     token = create_access_token({"sub": user.get("_id"), "role": user.get("role"), "name": user.get("full_name")})
     return Tokens(access_token=token)
 
 
 # Job Groups
-@app.post("/job-groups", dependencies=[Depends(require_role("admin"))])
-async def create_job_group(payload: Dict[str, Any], _=Depends(decode_token_dependency)):
-    job = JobGroup(**payload)
-    doc = create_document("jobgroup", job.model_dump())
+@app.post("/job-groups")
+async def create_job_group(payload: Dict[str, Any], _=Depends(require_role("admin"))):
+    job = JOB_GROUP_ADAPTER.validate_python(payload)
+    doc = await create_document("jobgroup", JOB_GROUP_ADAPTER.dump_python(job, mode="json"))
     return doc
 
 
 @app.get("/job-groups", dependencies=[Depends(require_role("admin", "team_lead"))])
 async def list_job_groups():
-    return get_documents("jobgroup")
+    return await get_documents("jobgroup")
 
 
 # Users
 @app.post("/users", dependencies=[Depends(require_role("admin"))])
 async def create_user(payload: Dict[str, Any]):
-    user = User(**payload)
-    doc = create_document("user", user.model_dump())
+    user = USER_ADAPTER.validate_python(payload)
+    doc = await create_document("user", USER_ADAPTER.dump_python(user, mode="json"))
     return doc
 
 
 @app.get("/users", dependencies=[Depends(require_role("admin", "team_lead"))])
 async def list_users():
-    return get_documents("user")
+    return await get_documents("user")
 
 
 # Safety Documents
 @app.post("/safety-docs", dependencies=[Depends(require_role("admin", "team_lead"))])
 async def create_safety_doc(payload: Dict[str, Any]):
-    doc = SafetyDocument(**payload)
-    return create_document("safetydocument", doc.model_dump())
+    doc = SAFETY_DOC_ADAPTER.validate_python(payload)
+    created = await create_document("safetydocument", SAFETY_DOC_ADAPTER.dump_python(doc, mode="json"))
+    try:
+        await redis.delete(f"safety:today:{doc.date.isoformat()}")
+    except RedisError:
+        # the insert already succeeded; a stale entry still expires by midnight
+        logger.warning("Could not invalidate safety doc cache", exc_info=True)
+    return created
 
 
 @app.get("/safety-docs/today")
 async def get_today_doc():
-    today = date.today().isoformat()
-    docs = get_documents("safetydocument", {"date": date.today()}, limit=1, sort=[["created_at", -1]])
-    return docs[0] if docs else None
+    today = date.today()
+    key = f"safety:today:{today.isoformat()}"
+    try:
+        cached = await redis.get(key)
+    except RedisError:
+        logger.warning("Safety doc cache unavailable, reading from Mongo", exc_info=True)
+        cached = None
+    if cached is None:
+        docs = await get_documents("safetydocument", {"date": today.isoformat()}, limit=1, sort=[["created_at", -1]])
+        cached = orjson.dumps(docs[0] if docs else None)
+        if docs:
+            # expire at midnight at the latest, so tomorrow never sees today's doc
+            midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+            ttl = min(SAFETY_DOC_CACHE_MAX_SECONDS, int((midnight - datetime.now()).total_seconds()) + 1)
+        else:
+            # keep "no doc yet" short-lived so a racing create is picked up quickly
+            ttl = SAFETY_DOC_CACHE_MISS_SECONDS
+        try:
+            await redis.setex(key, ttl, cached)
+        except RedisError:
+            logger.warning("Could not populate safety doc cache", exc_info=True)
+    return Response(cached, media_type="application/json")
 
 
 # Attendance
-@app.post("/attendance/sign", dependencies=[Depends(require_role("member", "team_lead", "admin"))])
-async def sign_attendance(payload: Dict[str, Any], user=Depends(decode_token_dependency)):
-    # enforce one per user per day
+@app.post("/attendance/sign")
+async def sign_attendance(payload: Dict[str, Any], user=Depends(require_role("member", "team_lead", "admin"))):
     uid = user.get("sub")
-    today = date.today()
-    existing = get_one("attendance", {"user_id": uid, "date": today})
-    if existing:
+    att = ATTENDANCE_ADAPTER.validate_python({**payload, "user_id": uid, "date": date.today()})
+    try:
+        return await create_document("attendance", ATTENDANCE_ADAPTER.dump_python(att, mode="json"))
+    except DuplicateKeyError:
         raise HTTPException(400, "Already signed today")
-    att = Attendance(**{**payload, "user_id": uid, "date": today})
-    return create_document("attendance", att.model_dump())
 
 
-@app.post("/attendance/approve", dependencies=[Depends(require_role("team_lead", "admin"))])
-async def approve_attendance(payload: Dict[str, Any], approver=Depends(decode_token_dependency)):
+@app.post("/attendance/approve")
+async def approve_attendance(payload: Dict[str, Any], approver=Depends(require_role("team_lead", "admin"))):
     att_id = payload.get("attendance_id")
     if not att_id:
         raise HTTPException(400, "attendance_id required")
+    try:
+        oid = ObjectId(att_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(400, "invalid attendance_id")
     # mark approved by approver sub
-    modified = update_document("attendance", {"_id": {"$eq": att_id}}, {"$set": {"approved": True, "approved_by": approver.get("sub")}})
+    modified = await update_document("attendance", {"_id": oid}, {"$set": {"approved": True, "approved_by": approver.get("sub")}})
     if not modified:
         raise HTTPException(404, "attendance not found")
     return {"approved": True}
 
 
+# signature_data is a base64 PNG, far larger than the rest of the row
+NO_SIGNATURE = {"signature_data": 0}
+
+
 @app.get("/attendance/today", dependencies=[Depends(require_role("team_lead", "admin"))])
 async def list_today_attendance():
-    today = date.today()
-    return get_documents("attendance", {"date": today})
+    today = date.today().isoformat()
+    return await get_documents("attendance", {"date": today}, projection=NO_SIGNATURE)
 
 
 # Reports
@@ -248,78 +308,95 @@ async def list_today_attendance():
 async def report_individual(user_id: str, start: Optional[str] = None, end: Optional[str] = None):
     q: Dict[str, Any] = {"user_id": user_id}
     if start:
-        q.setdefault("date", {})["$gte"] = date.fromisoformat(start)
+        q.setdefault("date", {})["$gte"] = date.fromisoformat(start).isoformat()
     if end:
-        q.setdefault("date", {})["$lte"] = date.fromisoformat(end)
-    return get_documents("attendance", q)
+        q.setdefault("date", {})["$lte"] = date.fromisoformat(end).isoformat()
+    return await get_documents("attendance", q, projection=NO_SIGNATURE)
 
 
 @app.get("/reports/team", dependencies=[Depends(require_role("team_lead", "admin"))])
 async def report_team(start: Optional[str] = None, end: Optional[str] = None):
     q: Dict[str, Any] = {}
     if start:
-        q.setdefault("date", {})["$gte"] = date.fromisoformat(start)
+        q.setdefault("date", {})["$gte"] = date.fromisoformat(start).isoformat()
     if end:
-        q.setdefault("date", {})["$lte"] = date.fromisoformat(end)
-    return get_documents("attendance", q)
+        q.setdefault("date", {})["$lte"] = date.fromisoformat(end).isoformat()
+    return await get_documents("attendance", q, projection=NO_SIGNATURE)
+
+
+CSV_FIELDS = ["_id", "user_id", "date", "approved", "approved_by"]
+CSV_BATCH_ROWS = 64
 
 
 @app.get("/export/attendance.csv", dependencies=[Depends(require_role("team_lead", "admin"))])
 async def export_attendance_csv():
-    rows = get_documents("attendance")
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=["_id", "user_id", "date", "approved", "approved_by"])
-    writer.writeheader()
-    for r in rows:
-        writer.writerow({
-            "_id": r.get("_id"),
-            "user_id": r.get("user_id"),
-            "date": r.get("date").isoformat() if isinstance(r.get("date"), date) else r.get("date"),
-            "approved": r.get("approved"),
-            "approved_by": r.get("approved_by"),
-        })
-    output.seek(0)
-    return StreamingResponse(iter([output.getvalue()]), media_type="text/csv", headers={"Content-Disposition": "attachment; filename=attendance.csv"})
+    async def row_iter():
+        # rows are assembled as bytes directly (ids and dates never need CSV quoting),
+        # flushed every CSV_BATCH_ROWS rows
+        batch = [b",".join(f.encode() for f in CSV_FIELDS) + b"\n"]
+        async for r in iter_documents("attendance", projection={f: 1 for f in CSV_FIELDS}):
+            d = r.get("date")
+            batch.append(b"%s,%s,%s,%s,%s\n" % (
+                r["_id"].encode(),
+                (r.get("user_id") or "").encode(),
+                (d.isoformat() if isinstance(d, date) else d or "").encode(),
+                b"1" if r.get("approved") else b"0",
+                (r.get("approved_by") or "").encode(),
+            ))
+            if len(batch) >= CSV_BATCH_ROWS:
+                yield b"".join(batch)
+                batch.clear()
+        yield b"".join(batch)
+
+    return StreamingResponse(row_iter(), media_type="text/csv", headers={"Content-Disposition": "attachment; filename=attendance.csv"})
 
 
 # Advanced exports: Excel and PDF
 import pandas as pd
 from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Table
+
+PDF_FIELDS = ["_id", "user_id", "date", "approved"]
+PDF_TABLE_ROWS = 200
+XLSX_FIELDS = ["_id", "user_id", "date", "device_info", "approved", "approved_by", "remarks"]
+
+
+def _render_xlsx(rows: List[Dict[str, Any]]) -> bytes:
+    df = pd.DataFrame.from_records(rows, columns=XLSX_FIELDS)
+    # normalize in bulk rather than per row
+    df["date"] = pd.to_datetime(df["date"], errors="coerce").dt.date
+    buf = io.BytesIO()
+    with pd.ExcelWriter(buf, engine="xlsxwriter") as writer:
+        df.to_excel(writer, index=False, sheet_name="Attendance")
+    return buf.getvalue()
 
 
 @app.get("/export/attendance.xlsx", dependencies=[Depends(require_role("team_lead", "admin"))])
 async def export_attendance_xlsx():
-    rows = get_documents("attendance")
-    # normalize date
-    for r in rows:
-        if isinstance(r.get("date"), date):
-            r["date"] = r["date"].isoformat()
-    df = pd.DataFrame(rows)
+    rows = [r async for r in iter_documents("attendance", projection={f: 1 for f in XLSX_FIELDS})]
+    # building the workbook is CPU-bound, keep it off the event loop
+    content = await run_in_threadpool(_render_xlsx, rows)
+    return Response(content, media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", headers={"Content-Disposition": "attachment; filename=attendance.xlsx"})
+
+
+def _render_pdf(rows: List[List[str]]) -> bytes:
+    header = ["ID", "User", "Date", "Approved"]
+    story = [Paragraph("Attendance Report", getSampleStyleSheet()["Heading2"])]
+    # several small tables split across pages far faster than one huge one
+    for i in range(0, len(rows), PDF_TABLE_ROWS):
+        story.append(Table([header] + rows[i:i + PDF_TABLE_ROWS], repeatRows=1))
     buf = io.BytesIO()
-    with pd.ExcelWriter(buf, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name="Attendance")
-    buf.seek(0)
-    return StreamingResponse(buf, media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", headers={"Content-Disposition": "attachment; filename=attendance.xlsx"})
+    SimpleDocTemplate(buf, pagesize=letter).build(story)
+    return buf.getvalue()
 
 
 @app.get("/export/attendance.pdf", dependencies=[Depends(require_role("team_lead", "admin"))])
 async def export_attendance_pdf():
-    rows = get_documents("attendance")
-    buf = io.BytesIO()
-    c = canvas.Canvas(buf, pagesize=letter)
-    width, height = letter
-    y = height - 50
-    c.setFont("Helvetica", 12)
-    c.drawString(50, y, "Attendance Report")
-    y -= 30
-    for r in rows[:40]:
-        line = f"{r.get('_id')} | {r.get('user_id')} | {r.get('date')} | approved={r.get('approved')}"
-        c.drawString(50, y, line)
-        y -= 18
-        if y < 50:
-            c.showPage()
-            y = height - 50
-    c.save()
-    buf.seek(0)
-    return StreamingResponse(buf, media_type="application/pdf", headers={"Content-Disposition": "attachment; filename=attendance.pdf"})
+    rows = [
+        [r["_id"], r.get("user_id") or "", str(r.get("date") or ""), str(r.get("approved", False))]
+        async for r in iter_documents("attendance", projection={f: 1 for f in PDF_FIELDS})
+    ]
+    # layout is CPU-bound, keep it off the event loop
+    content = await run_in_threadpool(_render_pdf, rows)
+    return Response(content, media_type="application/pdf", headers={"Content-Disposition": "attachment; filename=attendance.pdf"})
@@ -22,7 +22,17 @@ database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
 if database_url and database_name:
-    _client = MongoClient(database_url)
+    # fail fast when Mongo is unreachable instead of tying up worker threads for the 30s default
+    _client = MongoClient(
+        database_url,
+        maxPoolSize=50,
+        minPoolSize=5,
+        serverSelectionTimeoutMS=2000,
+        connectTimeoutMS=2000,
+        socketTimeoutMS=5000,
+        retryWrites=True,
+        compressors="zstd",
+    )
     db = _client[database_name]
 
 # Helper functions for common database operations
@@ -9,12 +9,20 @@ from pydantic import BaseModel
 from database import db, create_document, get_documents
 from schemas import User, JobGroup, Attendance, SafetyDocument, Payment
 
+# comma-separated, e.g. "https://app.example.com,https://admin.example.com"
+CORS_ORIGINS = [o.strip() for o in os.getenv("CORS_ORIGINS", "").split(",") if o.strip()]
+# e.g. r"http://localhost:\d+" for local development
+CORS_ORIGIN_REGEX = os.getenv("CORS_ORIGIN_REGEX")
+
 app = FastAPI(title="Brian Crafts – Attendance & Safety API")
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    # fall back to "*" only when neither origins nor a regex are configured
+    allow_origins=CORS_ORIGINS or ([] if CORS_ORIGIN_REGEX else ["*"]),
+    allow_origin_regex=CORS_ORIGIN_REGEX,
+    # credentials are only valid with explicit origins, never with "*"
+    allow_credentials=bool(CORS_ORIGINS or CORS_ORIGIN_REGEX),
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -210,22 +218,41 @@ def list_today_attendance(user: RBACUser = Depends(get_current_user)):
 # -----------------
 # Timesheets & Reports
 # -----------------
+def date_range_filter(start: Optional[date], end: Optional[date]) -> dict:
+    # BSON has no plain date type, so bounds are compared as ISO strings
+    rng = {}
+    if start:
+        rng["$gte"] = start.isoformat()
+    if end:
+        rng["$lte"] = end.isoformat()
+    return {"date": rng} if rng else {}
+
+
 @app.get("/reports/individual/{user_id}", response_model=dict)
-def individual_report(user_id: str, user: RBACUser = Depends(get_current_user)):
+def individual_report(
+    user_id: str,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    user: RBACUser = Depends(get_current_user),
+):
     # RBAC: members can only see their own; leads/admin can see anyone
     if user.role == "member" and user.id != user_id:
         raise HTTPException(status_code=403, detail="Cannot access another member's report")
 
-    # Aggregate attendance
-    present = db[COL_ATTENDANCE].count_documents({"user_id": user_id, "signed": True})
+    # Aggregate attendance in one round-trip
     # naive absence calc: total days in records vs present
-    total_days = db[COL_ATTENDANCE].distinct("date", {"user_id": user_id})
-    absent = max(0, len(total_days) - present)
-
-    # pay calc
-    u = db[COL_USERS].find_one({"_id": {"$exists": True}, "_id": {"$exists": True}})
-    # In real impl, fetch that specific user; here keep simple to avoid joins in this demo
-
+    facet = next(db[COL_ATTENDANCE].aggregate([
+        {"$match": {"user_id": user_id, **date_range_filter(start, end)}},
+        {"$facet": {
+            "present": [{"$match": {"signed": True}}, {"$count": "n"}],
+            "days": [{"$group": {"_id": "$date"}}, {"$count": "n"}],
+        }},
+    ]))
+    present = facet["present"][0]["n"] if facet["present"] else 0
+    total_days = facet["days"][0]["n"] if facet["days"] else 0
+    absent = max(0, total_days - present)
+
+    # pay calc: needs the user's rate, which is not joined in this demo
     total_pay = 0.0
     # If we had the user's rate and present days, compute
 
@@ -238,15 +265,30 @@ def individual_report(user_id: str, user: RBACUser = Depends(get_current_user)):
 
 
 @app.get("/reports/team", response_model=dict)
-def team_report(user: RBACUser = Depends(get_current_user)):
+def team_report(
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    user: RBACUser = Depends(get_current_user),
+):
     require_role(user, ["admin", "team_lead"])  # only
-    total_present = db[COL_ATTENDANCE].count_documents({"signed": True})
-    by_group = {}
-    # Summaries per job group (approximation for demo)
-    for a in db[COL_ATTENDANCE].find({"signed": True}):
-        uid = a.get("user_id")
-        u = db[COL_USERS].find_one({"_id": {"$exists": True}, "_id": {"$exists": True}})
-        # placeholder aggregation; real impl would join by user and group
+    # Join each signed attendance to its user and count per job group server-side.
+    # attendance.user_id holds the user's ObjectId as a string, hence the $convert.
+    pipeline = [
+        {"$match": {"signed": True, **date_range_filter(start, end)}},
+        {"$lookup": {
+            "from": COL_USERS,
+            "let": {"uid": {"$convert": {"input": "$user_id", "to": "objectId", "onError": None, "onNull": None}}},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$_id", "$$uid"]}}},
+                {"$project": {"job_group_id": 1}},
+            ],
+            "as": "u",
+        }},
+        {"$unwind": {"path": "$u", "preserveNullAndEmptyArrays": True}},
+        {"$group": {"_id": "$u.job_group_id", "present": {"$sum": 1}}},
+    ]
+    by_group = {r["_id"]: r["present"] for r in db[COL_ATTENDANCE].aggregate(pipeline)}
+    total_present = sum(by_group.values())
     return {
         "total_present": total_present,
         "by_group": by_group,